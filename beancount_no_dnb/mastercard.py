@@ -1,8 +1,21 @@
-"""DNB Mastercard Excel importer for Beancount."""
+"""DNB Mastercard Excel importer for Beancount.
+
+Worksheets are only ever read row by row: data rows come from
+_open_statement(), which wraps openpyxl's read-only
+iter_rows(values_only=True) or calamine's row iterator, and the header
+row is read straight from the archive by _read_header_row(). Do not add
+per-cell ws.cell() access; in read-only mode every call re-parses the
+sheet up to that cell.
+"""
 
 import datetime
+import functools
+import os
+import pickle
 import sys
-import traceback
+import xml.etree.ElementTree as ET
+import zipfile
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
@@ -12,9 +25,13 @@ from beangulp import Ingest, extract, similar
 from beangulp.testing import main as test_main
 from beancount.core import data
 from beancount.core.amount import Amount
-from beancount.core.number import D
 from openpyxl import load_workbook
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Optional Rust-backed reader; fall back to openpyxl
+    CalamineWorkbook = None
+
 from beancount_classifier import (
     AccountSplit,
     ClassifierMixin,
@@ -29,12 +46,29 @@ from beancount_no_dnb.models import (
 # Constants
 DEFAULT_CURRENCY = "NOK"
 
+# Suffix of the on-disk parse cache written next to a statement
+PARSE_CACHE_SUFFIX = ".beancount-no-dnb.cache"
+# Part of the cache key; bump it whenever parsing or ExcelFileData changes
+# so caches written by older versions are ignored
+PARSE_CACHE_VERSION = 1
+
 # Known description patterns
 PAYMENT_DESCRIPTION = "Innbetaling"
 BALANCE_FORWARD_DESCRIPTION = "Skyldig beløp fra forrige faktura"
 
-# Expected Excel headers
-EXPECTED_HEADERS = ("Dato", "Beløpet gjelder", "Valuta", "Kurs", "Inn", "Ut")
+# Expected Excel headers (interned, see _has_expected_headers)
+EXPECTED_HEADERS = tuple(
+    map(sys.intern, ("Dato", "Beløpet gjelder", "Valuta", "Kurs", "Inn", "Ut"))
+)
+
+# Locations inside the .xlsx archive used for header sniffing
+SHEET_XML_PATH = "xl/worksheets/sheet1.xml"
+SHARED_STRINGS_XML_PATH = "xl/sharedStrings.xml"
+WORKBOOK_XML_PATH = "xl/workbook.xml"
+WORKBOOK_RELS_XML_PATH = "xl/_rels/workbook.xml.rels"
+SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+RELATIONSHIPS_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_RELATIONSHIPS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
 
 
 @dataclass
@@ -51,6 +85,10 @@ class DnbMastercardConfig:
         dedup_window_days: Days to look back for duplicates.
         dedup_max_date_delta: Max days difference for duplicate detection.
         dedup_epsilon: Tolerance for amount differences in duplicates.
+        cache_parsed_files: When True, keep parsed statements in a pickle file
+            next to each statement so later runs can skip reading the workbook.
+            Only enable this for directories you trust: the cache is loaded
+            with pickle.
     """
 
     account_name: str
@@ -63,11 +101,16 @@ class DnbMastercardConfig:
     dedup_window_days: int = 3
     dedup_max_date_delta: int = 2
     dedup_epsilon: Decimal = Decimal("0.05")
+    cache_parsed_files: bool = False
 
 
+@functools.lru_cache(maxsize=4096, typed=True)
 def _parse_norwegian_number(value) -> Decimal | None:
     """Parse a number that may use Norwegian format (comma as decimal separator).
 
+    Memoized because statements repeat amounts (subscriptions, fixed fees).
+    The cache is typed so 100 and 100.0 keep their distinct Decimal forms.
+
     Args:
         value: The value to parse (can be float, int, str, or None)
 
@@ -77,37 +120,300 @@ def _parse_norwegian_number(value) -> Decimal | None:
     if value is None:
         return None
 
-    if isinstance(value, (int, float)):
-        return Decimal(str(value))
+    if isinstance(value, float):
+        return Decimal(repr(value))
+
+    if isinstance(value, int):
+        return Decimal(value)
 
     if isinstance(value, str):
         # Handle Norwegian number format: replace comma with period
-        cleaned = value.strip().replace(",", ".")
+        cleaned = value.strip()
         if not cleaned:
             return None
+        if "," in cleaned:
+            cleaned = cleaned.replace(",", ".")
         return Decimal(cleaned)
 
     return Decimal(str(value))
 
 
+def _calamine_value(value):
+    """Map a calamine cell value onto what openpyxl would return.
+
+    calamine reports empty cells as "" and every number as a float.
+    """
+    if value == "":
+        return None
+    if type(value) is float and value.is_integer():
+        return int(value)
+    return value
+
+
+def _cell_date(value) -> datetime.date | None:
+    """Convert a date cell value to a date, or None if it is not a date.
+
+    Readers return exactly datetime.datetime or datetime.date, so an exact
+    type check avoids walking the MRO for every row.
+    """
+    value_type = type(value)
+    if value_type is datetime.datetime:
+        return value.date()
+    if value_type is datetime.date:
+        return value
+    return None
+
+
+def _convert_row(date_val, description, valuta, kurs, inn, ut) -> tuple | None:
+    """Convert the six cell values of a statement row to typed values.
+
+    Returns (date, description, foreign_currency, exchange_rate, credit,
+    debit) in RawTransaction field order, or None for empty rows (no date
+    and no description).
+    """
+    if date_val is None and description is None:
+        return None
+
+    txn_date = _cell_date(date_val)
+
+    if description:
+        description = description.strip()
+    else:
+        description = None
+
+    return (
+        txn_date,
+        description,
+        valuta.strip() if isinstance(valuta, str) else None,
+        _parse_norwegian_number(kurs),
+        _parse_norwegian_number(inn),
+        _parse_norwegian_number(ut),
+    )
+
+
+def _iter_calamine_rows(sheet, columns: int) -> Iterator[tuple[int, list]]:
+    """Yield (row number, values) for the sheet's non-blank data rows.
+
+    Each row is cut or padded to `columns` values and mapped onto
+    openpyxl's types.
+    """
+    rows = sheet.iter_rows()
+    next(rows, None)  # Skip header row
+
+    for row_number, row in enumerate(rows, 2):
+        # Skip blank rows before any per-cell work
+        if not any(row):
+            continue
+        row = [_calamine_value(value) for value in row[:columns]]
+        row += [None] * (columns - len(row))
+        yield row_number, row
+
+
+def _iter_openpyxl_rows(wb, ws, columns: int) -> Iterator[tuple[int, tuple]]:
+    """Yield (row number, values) for the worksheet's non-blank data rows.
+
+    Rows are cut or padded to `columns` values. The workbook is closed once
+    the rows are exhausted or the iterator is discarded.
+    """
+    try:
+        rows = ws.iter_rows(min_row=2, max_col=columns, values_only=True)
+        for row_number, row in enumerate(rows, 2):
+            # Skip blank rows before any per-cell work
+            if any(row):
+                yield row_number, row
+    finally:
+        wb.close()
+
+
+def _open_statement(
+    filepath: str, columns: int = len(EXPECTED_HEADERS)
+) -> tuple[str, Iterator[tuple[int, Sequence]]]:
+    """Open the first worksheet of a statement.
+
+    Returns the sheet title and a lazy iterator over the row number and
+    first `columns` values of each non-blank data row. Uses python-calamine
+    when installed, openpyxl otherwise or if calamine cannot open the file.
+
+    The fallback only covers opening. calamine reads the whole sheet into
+    memory at that point, so read errors surface there. An error raised
+    while iterating the rows, for example while converting a cell, is not
+    retried with openpyxl; the caller treats the file as unparseable.
+    """
+    if CalamineWorkbook is not None:
+        try:
+            sheet = CalamineWorkbook.from_path(filepath).get_sheet_by_index(0)
+        except Exception:
+            # Let openpyxl try, and raise its error if it fails too
+            pass
+        else:
+            return sheet.name, _iter_calamine_rows(sheet, columns)
+
+    # Read-only mode streams rows without building Cell or style objects
+    wb = load_workbook(filepath, read_only=True, data_only=True, keep_links=False)
+    try:
+        # The first tab, not the active one, to match calamine's index 0
+        ws = wb.worksheets[0]
+        # Ignore the stored dimensions: exporters sometimes write "A1:A1",
+        # which would make iter_rows() stop after the header
+        ws.reset_dimensions()
+    except Exception:
+        wb.close()
+        raise
+
+    return ws.title, _iter_openpyxl_rows(wb, ws, columns)
+
+
+def _column_index(cell_ref: str) -> int:
+    """Convert a cell reference like 'C1' to a zero-based column index."""
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - ord("A") + 1)
+    return index - 1
+
+
+def _cell_text(cell: ET.Element) -> str:
+    """Concatenate the text runs of an element (inline or shared string)."""
+    return "".join(t.text or "" for t in cell.iter(f"{SPREADSHEET_NS}t"))
+
+
+def _read_shared_strings(
+    zf: zipfile.ZipFile, path: str, indices: set[int]
+) -> dict[int, str]:
+    """Read only the requested entries from the shared strings table.
+
+    Streams the table and stops once the highest requested index is reached.
+    """
+    strings = {}
+    last = max(indices)
+    with zf.open(path) as source:
+        position = 0
+        for _, elem in ET.iterparse(source, events=("end",)):
+            if elem.tag != f"{SPREADSHEET_NS}si":
+                continue
+            if position in indices:
+                strings[position] = _cell_text(elem)
+            if position >= last:
+                break
+            position += 1
+            elem.clear()
+    return strings
+
+
+def _workbook_part_paths(zf: zipfile.ZipFile) -> tuple[str, str]:
+    """Return the archive paths of the first worksheet and the shared strings.
+
+    "First" is tab order: the first <sheet> in xl/workbook.xml. That is the
+    sheet _open_statement() parses with either backend. Both parts are
+    resolved through the workbook relationships, since writers may store
+    them anywhere. The conventional xl/worksheets/sheet1.xml and
+    xl/sharedStrings.xml names are only used for bare archives without a
+    workbook part, or when no shared strings relationship exists.
+    """
+    try:
+        workbook_xml = zf.read(WORKBOOK_XML_PATH)
+    except KeyError:
+        return SHEET_XML_PATH, SHARED_STRINGS_XML_PATH
+
+    workbook = ET.fromstring(workbook_xml)
+    sheet = workbook.find(f"{SPREADSHEET_NS}sheets/{SPREADSHEET_NS}sheet")
+    sheet_rel_id = sheet.get(f"{RELATIONSHIPS_NS}id")
+
+    sheet_path = None
+    shared_strings_path = SHARED_STRINGS_XML_PATH
+    rels = ET.fromstring(zf.read(WORKBOOK_RELS_XML_PATH))
+    for rel in rels.iter(f"{PACKAGE_RELATIONSHIPS_NS}Relationship"):
+        target = rel.get("Target")
+        # Targets are relative to xl/ unless they start with a slash
+        path = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+        if rel.get("Id") == sheet_rel_id:
+            sheet_path = path
+        elif rel.get("Type", "").endswith("/sharedStrings"):
+            shared_strings_path = path
+
+    if sheet_path is None:
+        raise KeyError(f"No worksheet relationship {sheet_rel_id!r}")
+    return sheet_path, shared_strings_path
+
+
+def _read_header_row(filepath: str) -> tuple:
+    """Read the first six cells of row 1 directly from the .xlsx archive.
+
+    Streams the first worksheet and stops at the end of the first row, so
+    only a few KB are decompressed regardless of the statement size.
+    """
+    values: list = [None] * len(EXPECTED_HEADERS)
+    shared_refs: dict[int, int] = {}
+
+    with zipfile.ZipFile(filepath) as zf:
+        sheet_path, shared_strings_path = _workbook_part_paths(zf)
+        with zf.open(sheet_path) as source:
+            for _, elem in ET.iterparse(source, events=("end",)):
+                if elem.tag == f"{SPREADSHEET_NS}sheetData":
+                    break
+                if elem.tag != f"{SPREADSHEET_NS}row":
+                    continue
+                if elem.get("r", "1") != "1":
+                    break
+
+                for position, cell in enumerate(elem.iter(f"{SPREADSHEET_NS}c")):
+                    ref = cell.get("r")
+                    col = _column_index(ref) if ref else position
+                    if not 0 <= col < len(values):
+                        continue
+
+                    cell_type = cell.get("t")
+                    if cell_type == "inlineStr":
+                        values[col] = _cell_text(cell)
+                    elif cell_type == "s":
+                        shared_refs[col] = int(cell.findtext(f"{SPREADSHEET_NS}v"))
+                    else:
+                        values[col] = cell.findtext(f"{SPREADSHEET_NS}v")
+                break
+
+        if shared_refs:
+            strings = _read_shared_strings(
+                zf, shared_strings_path, set(shared_refs.values())
+            )
+            for col, string_index in shared_refs.items():
+                values[col] = strings.get(string_index)
+
+    return tuple(values)
+
+
 def _is_dnb_mastercard_file(filepath: str) -> bool:
     """Check if an Excel file is a DNB Mastercard statement.
 
     Verifies the file has the expected column headers.
     """
-    path = Path(filepath)
-
-    if path.suffix.lower() != ".xlsx":
+    if not filepath.lower().endswith(".xlsx"):
         return False
 
     try:
-        wb = load_workbook(filepath, read_only=True, data_only=True)
-        ws = wb.active
+        stat = os.stat(filepath)
+    except OSError:
+        return False
 
-        # Check headers in row 1
-        headers = tuple(ws.cell(row=1, column=col).value for col in range(1, 7))
-        wb.close()
+    return _has_expected_headers(
+        os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _has_expected_headers(filepath: str, mtime_ns: int, size: int) -> bool:
+    """Check the header row, memoized per (absolute path, mtime, size).
 
+    The modification time and size are only part of the cache key, so
+    editing or replacing the file invalidates the cached answer.
+    """
+    try:
+        # Interning the sniffed strings lets the tuple comparison settle
+        # each matching column on identity
+        headers = tuple(
+            sys.intern(value) if type(value) is str else value
+            for value in _read_header_row(filepath)
+        )
         return headers == EXPECTED_HEADERS
     except Exception:
         return False
@@ -133,7 +439,8 @@ class Importer(ClassifierMixin, beangulp.Importer):
             debug: Enable debug output (default: True).
         """
         self.account_name = config.account_name
-        self.currency = config.currency
+        # Interned so every Amount shares the same currency string object
+        self.currency = sys.intern(config.currency)
         self.transaction_patterns = config.transaction_patterns
         self.default_account = config.default_account
         self.default_split_percentage = (
@@ -141,66 +448,169 @@ class Importer(ClassifierMixin, beangulp.Importer):
             if config.default_split_percentage is not None
             else None
         )
-        self.skip_balance_forward = config.skip_balance_forward
-        self.skip_payments = config.skip_payments
+        # Descriptions to skip, mapped to the label used in debug output
+        self._skip_descriptions = {
+            description: label
+            for description, label, enabled in (
+                (BALANCE_FORWARD_DESCRIPTION, "balance forward", config.skip_balance_forward),
+                (PAYMENT_DESCRIPTION, "payment", config.skip_payments),
+            )
+            if enabled
+        }
         self.dedup_window = datetime.timedelta(days=config.dedup_window_days)
         self.dedup_max_date_delta = datetime.timedelta(days=config.dedup_max_date_delta)
         self.dedup_epsilon = config.dedup_epsilon
+        self.cache_parsed_files = config.cache_parsed_files
         self.flag = flag
         self.debug = debug
+        self._parse_cached = functools.lru_cache(maxsize=32)(self._parse_file_version)
+
+    @property
+    def skip_balance_forward(self) -> bool:
+        """Whether balance forward entries are skipped (fixed by the config)."""
+        return BALANCE_FORWARD_DESCRIPTION in self._skip_descriptions
+
+    @property
+    def skip_payments(self) -> bool:
+        """Whether payment entries are skipped (fixed by the config)."""
+        return PAYMENT_DESCRIPTION in self._skip_descriptions
 
     def _parse_excel_file(self, filepath: str) -> ExcelFileData:
-        """Parse the Excel file and extract transactions."""
-        result = ExcelFileData()
+        """Parse the Excel file, reusing the result while the file is unchanged.
 
+        beangulp calls identify(), date() and extract() on the same file, so
+        parses are memoized per (absolute path, mtime, size). Editing or
+        replacing the file changes the key and invalidates the entry.
+        """
         try:
-            wb = load_workbook(filepath, read_only=True, data_only=True)
-            ws = wb.active
-            result.sheet_name = ws.title
-
-            # Skip header row, process data rows
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                date_val = row[0] if len(row) > 0 else None
-                description = row[1] if len(row) > 1 else None
-                valuta = row[2] if len(row) > 2 else None
-                kurs = row[3] if len(row) > 3 else None
-                inn = row[4] if len(row) > 4 else None
-                ut = row[5] if len(row) > 5 else None
-
-                # Skip empty rows
-                if date_val is None and description is None:
-                    continue
+            stat = os.stat(filepath)
+        except OSError:
+            return self._load_excel_file(filepath)
 
-                # Convert date if it's a datetime
-                txn_date = None
-                if date_val is not None:
-                    if isinstance(date_val, datetime.datetime):
-                        txn_date = date_val.date()
-                    elif isinstance(date_val, datetime.date):
-                        txn_date = date_val
-
-                raw_txn = RawTransaction(
-                    date=txn_date,
-                    description=description.strip() if description else None,
-                    foreign_currency=valuta.strip() if isinstance(valuta, str) else None,
-                    exchange_rate=_parse_norwegian_number(kurs),
-                    credit=_parse_norwegian_number(inn),
-                    debit=_parse_norwegian_number(ut),
-                )
+        return self._parse_cached(
+            os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size
+        )
 
-                result.transactions.append(raw_txn)
+    def _parse_file_version(
+        self, filepath: str, mtime_ns: int, size: int
+    ) -> ExcelFileData:
+        """Parse one version of a file; mtime_ns and size only key the cache.
 
-            wb.close()
-            return result
+        With cache_parsed_files enabled, the on-disk cache is consulted
+        first and refreshed after a successful parse.
+        """
+        if not self.cache_parsed_files:
+            return self._load_excel_file(filepath)
+
+        # Skipped rows are left out of the parse, so the settings are part
+        # of the key alongside the file and cache format versions
+        cache_key = (
+            PARSE_CACHE_VERSION,
+            mtime_ns,
+            size,
+            tuple(sorted(self._skip_descriptions)),
+        )
+        cache_path = filepath + PARSE_CACHE_SUFFIX
+
+        cached = self._read_parse_cache(cache_path, cache_key)
+        if cached is not None:
+            return cached
 
+        result = self._load_excel_file(filepath)
+        # Empty results may come from a failed parse; don't persist those
+        if result or result.max_date is not None:
+            self._write_parse_cache(cache_path, cache_key, result)
+        return result
+
+    def _read_parse_cache(self, cache_path: str, cache_key: tuple) -> ExcelFileData | None:
+        """Load a cached parse, or None if it is missing, stale or unreadable."""
+        try:
+            with open(cache_path, "rb") as f:
+                key, result = pickle.load(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             if self.debug:
-                print(
-                    f"Error parsing Excel file: {traceback.format_exc()}",
-                    file=sys.stderr,
-                )
+                print(f"Ignoring unreadable cache {cache_path}: {e}", file=sys.stderr)
+            return None
+
+        if key != cache_key or not isinstance(result, ExcelFileData):
+            return None
+        return result
+
+    def _write_parse_cache(
+        self, cache_path: str, cache_key: tuple, result: ExcelFileData
+    ) -> None:
+        """Persist a parse; failures only cost the next run a re-parse."""
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((cache_key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Replace atomically so concurrent readers never see a partial file
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            if self.debug:
+                print(f"Could not write cache {cache_path}: {e}", file=sys.stderr)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _load_excel_file(self, filepath: str) -> ExcelFileData:
+        """Parse the Excel file and extract transactions.
+
+        Empty rows are dropped, and so are rows whose description is
+        configured to be skipped, before any of their amounts are parsed.
+        The latest date is tracked across all rows, skipped ones included.
+        """
+        debug = self.debug
+        skip_descriptions = self._skip_descriptions
+
+        try:
+            sheet_name, rows = _open_statement(filepath)
+            result = ExcelFileData(sheet_name=sheet_name)
+            append_row = result.append_row
+            max_date = None
+
+            # Unpack the cells in the loop header instead of indexing each row
+            for row_number, (date_val, description, valuta, kurs, inn, ut) in rows:
+                if skip_descriptions and isinstance(description, str):
+                    skip_label = skip_descriptions.get(description.strip())
+                    if skip_label is not None:
+                        if debug:
+                            print(
+                                f"Skipping {skip_label} entry at row {row_number}",
+                                file=sys.stderr,
+                            )
+                        txn_date = _cell_date(date_val)
+                        if txn_date is not None and (max_date is None or txn_date > max_date):
+                            max_date = txn_date
+                        continue
+
+                values = _convert_row(date_val, description, valuta, kurs, inn, ut)
+                if values is None:
+                    continue
+                txn_date = values[0]
+                if txn_date is not None and (max_date is None or txn_date > max_date):
+                    max_date = txn_date
+                append_row(*values, row_number)
+
+            result.max_date = max_date
+            return result
+        except Exception:
+            self._report_parse_error()
             return ExcelFileData()
 
+    def _report_parse_error(self) -> None:
+        """Print the current parse error when debug output is enabled."""
+        if self.debug:
+            import traceback
+
+            print(
+                f"Error parsing Excel file: {traceback.format_exc()}",
+                file=sys.stderr,
+            )
+
     def identify(self, filepath: str) -> bool:
         """Check if the file is a DNB Mastercard Excel statement."""
         return _is_dnb_mastercard_file(filepath)
@@ -217,18 +627,12 @@ class Importer(ClassifierMixin, beangulp.Importer):
 
     def date(self, filepath: str) -> datetime.date | None:
         """Extract the latest transaction date from the file."""
-        parsed_data = self._parse_excel_file(filepath)
-
-        dates = [
-            txn.date
-            for txn in parsed_data.transactions
-            if txn.date is not None
-        ]
+        max_date = self._parse_excel_file(filepath).max_date
 
-        if not dates:
+        if max_date is None:
             return datetime.date.today()
 
-        return max(dates)
+        return max_date
 
     def extract(
         self, filepath: str, existing_entries: list[data.Directive]
@@ -242,110 +646,142 @@ class Importer(ClassifierMixin, beangulp.Importer):
         Returns:
             List of extracted Beancount Transaction directives
         """
-        entries = []
+        entries: list[data.Directive] = self.extract_transactions(filepath)
+
+        if existing_entries:
+            self.deduplicate(entries, existing_entries)
+
+        return entries
+
+    def extract_transactions(self, filepath: str) -> list[data.Transaction]:
+        """Build the Transaction directives for a statement, without deduplication.
+
+        Every entry returned by extract() is a Transaction, so callers that
+        only need the transactions can use this directly.
+
+        Args:
+            filepath: Path to the Excel file
 
+        Returns:
+            List of Beancount Transaction directives
+        """
         # Parse the Excel file
         excel_data = self._parse_excel_file(filepath)
-        if not excel_data.transactions:
+        if not excel_data:
             if self.debug:
                 print(f"No transactions found in {filepath}", file=sys.stderr)
             return []
 
-        # Process each transaction
-        for idx, raw_txn in enumerate(excel_data.transactions, 1):
+        # Each row yields at most one transaction, so size the list up front
+        # and trim the unused tail once the rows are processed
+        entries: list = [None] * len(excel_data)
+        count = 0
+
+        # Bind loop invariants to locals to avoid repeated attribute lookups
+        debug = self.debug
+        account_name = self.account_name
+        currency = self.currency
+        flag = self.flag
+        finalize = self.finalize
+        new_metadata = data.new_metadata
+        new_amount = Amount
+        Posting = data.Posting
+        Transaction = data.Transaction
+        empty_set = data.EMPTY_SET
+
+        # Process each row, reading the columns in lockstep. Line numbers
+        # are worksheet rows, so they don't depend on which rows the skip
+        # settings removed
+        rows = zip(
+            excel_data.dates,
+            excel_data.descriptions,
+            excel_data.foreign_currencies,
+            excel_data.exchange_rates,
+            excel_data.credits,
+            excel_data.debits,
+        )
+        for row_number, row in zip(excel_data.row_numbers, rows):
+            txn_date, description, _, _, credit, debit = row
             try:
                 # Skip transactions without date
-                if raw_txn.date is None:
-                    if self.debug:
-                        print(
-                            f"Skipping transaction {idx}: missing date",
-                            file=sys.stderr,
-                        )
-                    continue
-
-                # Skip balance forward entries if configured
-                description = raw_txn.description or ""
-                if self.skip_balance_forward and description == BALANCE_FORWARD_DESCRIPTION:
-                    if self.debug:
+                if txn_date is None:
+                    if debug:
                         print(
-                            f"Skipping balance forward entry at row {idx}",
+                            f"Skipping transaction at row {row_number}: missing date",
                             file=sys.stderr,
                         )
                     continue
 
-                # Skip payment entries if configured
-                if self.skip_payments and description == PAYMENT_DESCRIPTION:
-                    if self.debug:
-                        print(
-                            f"Skipping payment entry at row {idx}",
-                            file=sys.stderr,
-                        )
-                    continue
+                description = description or ""
 
                 # Calculate amount: credits are positive (Inn), debits are negative (Ut)
-                if raw_txn.credit is not None:
-                    amount_decimal = raw_txn.credit
-                elif raw_txn.debit is not None:
-                    amount_decimal = -raw_txn.debit
+                if credit is not None:
+                    amount_decimal = credit
+                elif debit is not None:
+                    amount_decimal = -debit
                 else:
-                    if self.debug:
+                    if debug:
                         print(
-                            f"Skipping transaction {idx}: no amount",
+                            f"Skipping transaction at row {row_number}: no amount",
                             file=sys.stderr,
                         )
                     continue
 
                 # Create metadata
-                metadata = data.new_metadata(filepath, idx)
+                metadata = new_metadata(filepath, row_number)
 
                 # Add transaction type
-                if raw_txn.credit is not None:
+                if credit is not None:
                     metadata["type"] = "CREDIT"
                 else:
                     metadata["type"] = "DEBIT"
 
                 # Create the primary posting
-                amount_obj = Amount(D(str(amount_decimal)), self.currency)
-                primary_posting = data.Posting(
-                    self.account_name, amount_obj, None, None, None, None
+                amount_obj = new_amount(amount_decimal, currency)
+                primary_posting = Posting(
+                    account_name, amount_obj, None, None, None, None
                 )
 
-                # Create the transaction
-                txn = data.Transaction(
-                    meta=metadata,
-                    date=raw_txn.date,
-                    flag=self.flag,
-                    payee=None,
-                    narration=description,
-                    tags=data.EMPTY_SET,
-                    links=data.EMPTY_SET,
-                    postings=[primary_posting],
+                # Create the transaction (positional: meta, date, flag, payee,
+                # narration, tags, links, postings)
+                txn = Transaction(
+                    metadata,
+                    txn_date,
+                    flag,
+                    None,
+                    description,
+                    empty_set,
+                    empty_set,
+                    [primary_posting],
                 )
 
                 # Apply classification (adds balancing posting)
-                finalized_txn = self.finalize(txn, raw_txn)
+                # The classifier gets a RawTransaction view, built only for
+                # rows that made it this far
+                finalized_txn = finalize(txn, RawTransaction(*row))
 
                 if finalized_txn is None:
-                    if self.debug:
+                    if debug:
                         print(
-                            f"Skipping transaction {idx} after finalization",
+                            f"Skipping transaction at row {row_number} after finalization",
                             file=sys.stderr,
                         )
                     continue
 
-                entries.append(finalized_txn)
+                entries[count] = finalized_txn
+                count += 1
 
             except Exception as e:
-                if self.debug:
+                if debug:
+                    import traceback
+
                     print(
-                        f"Error processing transaction {idx}: {e}\n{traceback.format_exc()}",
+                        f"Error processing transaction at row {row_number}: {e}\n{traceback.format_exc()}",
                         file=sys.stderr,
                     )
                 continue
 
-        if existing_entries:
-            self.deduplicate(entries, existing_entries)
-
+        del entries[count:]
         return entries
 
     def deduplicate(
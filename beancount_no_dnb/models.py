@@ -1,13 +1,27 @@
 """Data models for DNB Excel file parsing."""
 
 import datetime
+import functools
+from collections.abc import Iterable
+from dataclasses import dataclass
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, field_validator
 
 
-class RawTransaction(BaseModel):
-    """Raw transaction data extracted from DNB Excel file."""
+@functools.lru_cache(maxsize=2048)
+def _to_decimal(raw: str) -> Decimal:
+    """Convert a numeric string to Decimal, memoized for repeated amounts."""
+    return Decimal(raw)
+
+
+@dataclass(slots=True)
+class RawTransaction:
+    """Raw transaction data extracted from DNB Excel file.
+
+    A plain slotted dataclass rather than a Pydantic model: one is built per
+    worksheet row from already-typed cell values, so validation is not needed.
+    """
 
     date: datetime.date | None = None
     description: str | None = None
@@ -30,11 +44,106 @@ class ParsedTransaction(BaseModel):
     @classmethod
     def validate_amount(cls, v):
         """Ensure amount is a valid decimal."""
-        return Decimal(str(v)) if not isinstance(v, Decimal) else v
+        if isinstance(v, Decimal):
+            return v
+        if isinstance(v, str):
+            return _to_decimal(v)
+        if isinstance(v, float):
+            return _to_decimal(repr(v))
+        return _to_decimal(str(v))
+
+
+# init=False: the constructor takes rows, not one argument per column list
+@dataclass(slots=True, init=False)
+class ExcelFileData:
+    """Data extracted from a DNB Excel file.
+
+    Stored column-wise: one list per worksheet column, all in row order,
+    so parsing appends plain values instead of allocating an object per
+    row. `transactions` builds a read-only tuple of RawTransaction views on
+    demand; use append() to add rows.
+
+    `row_numbers` holds the worksheet row each entry came from (None for
+    rows appended without one), so line numbers survive skipped rows.
+    `max_date` is the latest date seen while parsing, including rows that
+    were skipped and so are not stored.
+    """
+
+    dates: list[datetime.date | None]
+    descriptions: list[str | None]
+    foreign_currencies: list[str | None]
+    exchange_rates: list[Decimal | None]
+    credits: list[Decimal | None]
+    debits: list[Decimal | None]
+    row_numbers: list[int | None]
+    sheet_name: str | None
+    max_date: datetime.date | None
+
+    def __init__(
+        self,
+        transactions: Iterable[RawTransaction] = (),
+        sheet_name: str | None = None,
+        max_date: datetime.date | None = None,
+    ):
+        self.dates = []
+        self.descriptions = []
+        self.foreign_currencies = []
+        self.exchange_rates = []
+        self.credits = []
+        self.debits = []
+        self.row_numbers = []
+        self.sheet_name = sheet_name
+        self.max_date = max_date
+        for txn in transactions:
+            self.append(txn)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def append_row(
+        self,
+        date: datetime.date | None,
+        description: str | None,
+        foreign_currency: str | None,
+        exchange_rate: Decimal | None,
+        credit: Decimal | None,
+        debit: Decimal | None,
+        row_number: int | None = None,
+    ) -> None:
+        """Append one row of already-converted values."""
+        self.dates.append(date)
+        self.descriptions.append(description)
+        self.foreign_currencies.append(foreign_currency)
+        self.exchange_rates.append(exchange_rate)
+        self.credits.append(credit)
+        self.debits.append(debit)
+        self.row_numbers.append(row_number)
 
+    def append(self, txn: RawTransaction) -> None:
+        """Append a RawTransaction as one row."""
+        self.append_row(
+            txn.date,
+            txn.description,
+            txn.foreign_currency,
+            txn.exchange_rate,
+            txn.credit,
+            txn.debit,
+        )
 
-class ExcelFileData(BaseModel):
-    """Data extracted from a DNB Excel file."""
+    @property
+    def transactions(self) -> tuple[RawTransaction, ...]:
+        """The rows as RawTransaction objects, built on each access.
 
-    transactions: list[RawTransaction] = Field(default_factory=list)
-    sheet_name: str | None = None
+        A read-only snapshot: add rows with append() or append_row().
+        """
+        return tuple(
+            RawTransaction(*row)
+            for row in zip(
+                self.dates,
+                self.descriptions,
+                self.foreign_currencies,
+                self.exchange_rates,
+                self.credits,
+                self.debits,
+            )
+        )
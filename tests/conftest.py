@@ -1,10 +1,13 @@
 """Shared pytest fixtures for beancount-no-dnb tests."""
 
 import datetime
+import zipfile
+from collections.abc import Callable
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
+from beancount.core import data
 from openpyxl import Workbook
 
 from beancount_no_dnb.mastercard import DnbMastercardConfig, Importer
@@ -21,13 +24,13 @@ from beancount_no_dnb.models import (
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_dir() -> Path:
     """Path to the test_data directory containing sample Excel files."""
     return Path(__file__).parent.parent / "test_data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_excel_path(test_data_dir) -> Path:
     """Path to the sample Excel file."""
     return test_data_dir / "sample_statement.xlsx"
@@ -162,9 +165,12 @@ def importer_include_all(config_include_all) -> Importer:
 # =============================================================================
 
 
-@pytest.fixture
-def minimal_excel_file(tmp_path) -> Path:
-    """Create a minimal valid Excel file for testing."""
+@pytest.fixture(scope="session")
+def minimal_excel_file(tmp_path_factory) -> Path:
+    """Create a minimal valid Excel file for testing.
+
+    Session-scoped: saving a workbook is slow and tests only read it.
+    """
     wb = Workbook()
     ws = wb.active
     ws.title = "transaksjonsliste"
@@ -179,14 +185,17 @@ def minimal_excel_file(tmp_path) -> Path:
     ws.cell(row=2, column=2, value="TEST MERCHANT")
     ws.cell(row=2, column=6, value=100.00)
 
-    file_path = tmp_path / "minimal.xlsx"
+    file_path = tmp_path_factory.mktemp("workbooks") / "minimal.xlsx"
     wb.save(file_path)
     return file_path
 
 
-@pytest.fixture
-def excel_with_all_types(tmp_path) -> Path:
-    """Create an Excel file with all transaction types."""
+@pytest.fixture(scope="session")
+def excel_with_all_types(tmp_path_factory) -> Path:
+    """Create an Excel file with all transaction types.
+
+    Session-scoped: saving a workbook is slow and tests only read it.
+    """
     wb = Workbook()
     ws = wb.active
     ws.title = "transaksjonsliste"
@@ -210,6 +219,44 @@ def excel_with_all_types(tmp_path) -> Path:
         for col, value in enumerate(txn, 1):
             ws.cell(row=row_num, column=col, value=value)
 
-    file_path = tmp_path / "all_types.xlsx"
+    file_path = tmp_path_factory.mktemp("workbooks") / "all_types.xlsx"
     wb.save(file_path)
     return file_path
+
+
+@pytest.fixture(scope="session")
+def rewrite_xlsx() -> Callable[..., Path]:
+    """Copy an .xlsx archive member by member, passing each through a transform.
+
+    The returned helper is called as rewrite_xlsx(src, dst, transform), where
+    transform(name, content) returns the (name, content) to write.
+    """
+
+    def rewrite(
+        src: Path, dst: Path, transform: Callable[[str, bytes], tuple[str, bytes]]
+    ) -> Path:
+        with zipfile.ZipFile(src) as zin, zipfile.ZipFile(dst, "w") as zout:
+            for item in zin.infolist():
+                name, content = transform(item.filename, zin.read(item.filename))
+                zout.writestr(name, content)
+        return dst
+
+    return rewrite
+
+
+# =============================================================================
+# Extracted Transaction Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def all_types_transactions(excel_with_all_types) -> list[data.Transaction]:
+    """All-types file extracted once per module with the basic configuration."""
+    importer = Importer(
+        config=DnbMastercardConfig(
+            account_name="Liabilities:CreditCard:DNB",
+            currency="NOK",
+        ),
+        debug=False,
+    )
+    return importer.extract_transactions(str(excel_with_all_types))
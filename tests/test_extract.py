@@ -12,6 +12,7 @@ from beancount.core import data
 from beancount.core.number import D
 from openpyxl import Workbook
 
+from beancount_no_dnb import mastercard
 from beancount_no_dnb.mastercard import DnbMastercardConfig, Importer
 
 
@@ -31,6 +32,16 @@ class TestExtractBasics:
         transactions = [e for e in entries if isinstance(e, data.Transaction)]
         assert len(transactions) >= 1
 
+    def test_extract_transactions_matches_extract(
+        self, basic_importer, excel_with_all_types
+    ):
+        """extract_transactions() returns the same Transactions as extract()."""
+        entries = basic_importer.extract(str(excel_with_all_types), [])
+        transactions = basic_importer.extract_transactions(str(excel_with_all_types))
+
+        assert all(isinstance(t, data.Transaction) for t in transactions)
+        assert transactions == entries
+
     def test_transaction_has_correct_date(self, basic_importer, minimal_excel_file):
         """Transaction date is correctly parsed."""
         entries = basic_importer.extract(str(minimal_excel_file), [])
@@ -66,26 +77,20 @@ class TestExtractBasics:
 class TestExtractCreditsAndDebits:
     """Tests for handling credits (Inn) and debits (Ut)."""
 
-    def test_debit_transactions_are_negative(self, basic_importer, excel_with_all_types):
+    def test_debit_transactions_are_negative(self, all_types_transactions):
         """Debit transactions (Ut column) have negative amounts."""
-        entries = basic_importer.extract(str(excel_with_all_types), [])
-        transactions = [e for e in entries if isinstance(e, data.Transaction)]
-
         # Find debit transaction (REMA)
         rema_txn = next(
-            (t for t in transactions if "REMA" in (t.narration or "")), None
+            (t for t in all_types_transactions if "REMA" in (t.narration or "")), None
         )
         assert rema_txn is not None
         assert rema_txn.postings[0].units.number < 0
 
-    def test_credit_transactions_are_positive(self, basic_importer, excel_with_all_types):
+    def test_credit_transactions_are_positive(self, all_types_transactions):
         """Credit transactions (Inn column) have positive amounts."""
-        entries = basic_importer.extract(str(excel_with_all_types), [])
-        transactions = [e for e in entries if isinstance(e, data.Transaction)]
-
         # Find credit transaction (Refund)
         refund_txn = next(
-            (t for t in transactions if "Refund" in (t.narration or "")), None
+            (t for t in all_types_transactions if "Refund" in (t.narration or "")), None
         )
         assert refund_txn is not None
         assert refund_txn.postings[0].units.number > 0
@@ -94,28 +99,31 @@ class TestExtractCreditsAndDebits:
 class TestExtractSkipBehavior:
     """Tests for skip configuration options."""
 
-    def test_balance_forward_skipped_by_default(self, basic_importer, excel_with_all_types):
+    def test_balance_forward_skipped_by_default(self, all_types_transactions):
         """Balance forward entries are skipped by default."""
-        entries = basic_importer.extract(str(excel_with_all_types), [])
-        transactions = [e for e in entries if isinstance(e, data.Transaction)]
-
         # Should not find balance forward
         balance_txn = next(
-            (t for t in transactions if "forrige faktura" in (t.narration or "")), None
+            (t for t in all_types_transactions if "forrige faktura" in (t.narration or "")), None
         )
         assert balance_txn is None
 
-    def test_payments_included_by_default(self, basic_importer, excel_with_all_types):
+    def test_payments_included_by_default(self, all_types_transactions):
         """Payment entries are included by default."""
-        entries = basic_importer.extract(str(excel_with_all_types), [])
-        transactions = [e for e in entries if isinstance(e, data.Transaction)]
-
         # Should find payment (Innbetaling)
         payment_txn = next(
-            (t for t in transactions if "Innbetaling" in (t.narration or "")), None
+            (t for t in all_types_transactions if "Innbetaling" in (t.narration or "")), None
         )
         assert payment_txn is not None
 
+    def test_skip_settings_are_read_only(self, basic_importer):
+        """Skip settings reflect the config and can't be changed afterwards."""
+        assert basic_importer.skip_balance_forward is True
+        assert basic_importer.skip_payments is False
+
+        # Parses are cached per importer, so the settings are fixed at creation
+        with pytest.raises(AttributeError):
+            basic_importer.skip_payments = True
+
     def test_include_all_entries(self, importer_include_all, excel_with_all_types):
         """When configured, all entries including balance forward are included."""
         entries = importer_include_all.extract(str(excel_with_all_types), [])
@@ -161,6 +169,25 @@ class TestExtractMetadata:
         assert "type" in txn.meta
         assert txn.meta["type"] == "DEBIT"
 
+    def test_lineno_is_worksheet_row(
+        self, basic_importer, importer_include_all, excel_with_all_types
+    ):
+        """Line numbers are worksheet rows, whichever rows are skipped."""
+        expected = {
+            "Skyldig beløp fra forrige faktura": 2,
+            "Innbetaling": 3,
+            "REMA 1000 OSLO, Oslo": 4,
+            "Refund - Something": 5,
+        }
+        for importer in (basic_importer, importer_include_all):
+            transactions = importer.extract_transactions(str(excel_with_all_types))
+            for txn in transactions:
+                assert txn.meta["lineno"] == expected[txn.narration]
+
+        # The balance forward row is skipped by default
+        skipped = basic_importer.extract_transactions(str(excel_with_all_types))
+        assert len(skipped) == 3
+
     def test_transaction_has_file_location_metadata(
         self, basic_importer, minimal_excel_file
     ):
@@ -234,6 +261,145 @@ class TestExtractEdgeCases:
         entries = basic_importer.extract(str(file_path), [])
         assert entries == []
 
+    def test_wrong_stored_dimensions_are_ignored(
+        self, basic_importer, minimal_excel_file, rewrite_xlsx, tmp_path
+    ):
+        """Rows are read even if the sheet's stored dimension is wrong."""
+
+        def shrink_dimension(name, content):
+            if name == "xl/worksheets/sheet1.xml":
+                content = content.replace(
+                    b'<dimension ref="A1:F2"/>', b'<dimension ref="A1:A1"/>'
+                )
+            return name, content
+
+        file_path = rewrite_xlsx(
+            minimal_excel_file, tmp_path / "bad_dimension.xlsx", shrink_dimension
+        )
+
+        entries = basic_importer.extract(str(file_path), [])
+        assert len(entries) == 1
+
+    def test_reads_first_sheet_not_active_sheet(self, basic_importer, tmp_path):
+        """The first worksheet is parsed even when another tab is active."""
+        wb = Workbook()
+        headers = ["Dato", "Beløpet gjelder", "Valuta", "Kurs", "Inn", "Ut"]
+        for ws, narration in (
+            (wb.active, "FIRST SHEET"),
+            (wb.create_sheet("Other"), "ACTIVE SHEET"),
+        ):
+            ws.append(headers)
+            ws.append([datetime.datetime(2025, 10, 24), narration, None, None, None, 10.0])
+        wb.active = 1
+
+        file_path = tmp_path / "two_sheets.xlsx"
+        wb.save(file_path)
+
+        entries = basic_importer.extract(str(file_path), [])
+        assert [e.narration for e in entries] == ["FIRST SHEET"]
+
+    def test_falls_back_to_openpyxl_when_calamine_fails(
+        self, basic_importer, minimal_excel_file, monkeypatch
+    ):
+        """Files that python-calamine cannot open are read with openpyxl."""
+
+        class FailingWorkbook:
+            @classmethod
+            def from_path(cls, path):
+                raise ValueError("unsupported workbook")
+
+        monkeypatch.setattr(mastercard, "CalamineWorkbook", FailingWorkbook)
+
+        entries = basic_importer.extract(str(minimal_excel_file), [])
+        assert len(entries) == 1
+        assert entries[0].narration == "TEST MERCHANT"
+
+
+class TestParseCache:
+    """Tests for the optional on-disk parse cache."""
+
+    @pytest.fixture
+    def statement(self, minimal_excel_file, tmp_path):
+        """A private copy of the minimal statement, so cache files stay local."""
+        file_path = tmp_path / "statement.xlsx"
+        file_path.write_bytes(minimal_excel_file.read_bytes())
+        return file_path
+
+    @pytest.fixture
+    def opened_statements(self, monkeypatch):
+        """Record every workbook opened by the importer, in call order."""
+        opened = []
+        original = mastercard._open_statement
+
+        def tracking(*args, **kwargs):
+            opened.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(mastercard, "_open_statement", tracking)
+        return opened
+
+    @staticmethod
+    def make_importer(**options) -> Importer:
+        return Importer(
+            config=DnbMastercardConfig(
+                account_name="Liabilities:CreditCard:DNB",
+                cache_parsed_files=True,
+                **options,
+            ),
+            debug=False,
+        )
+
+    def test_disabled_by_default(self, basic_importer, statement):
+        """No cache file is written unless enabled in the config."""
+        basic_importer.extract(str(statement), [])
+        assert not (statement.parent / "statement.xlsx.beancount-no-dnb.cache").exists()
+
+    def test_cache_is_reused_across_importers(self, statement, opened_statements):
+        """A fresh importer loads the cached parse instead of the workbook."""
+        first = self.make_importer().extract(str(statement), [])
+        assert (statement.parent / "statement.xlsx.beancount-no-dnb.cache").exists()
+        opened_statements.clear()
+
+        second = self.make_importer().extract(str(statement), [])
+
+        assert not opened_statements
+
+        assert [t.narration for t in second] == [t.narration for t in first]
+        assert [t.postings[0].units for t in second] == [
+            t.postings[0].units for t in first
+        ]
+
+    def test_cache_ignored_when_skip_settings_differ(self, statement, opened_statements):
+        """Importers with different skip settings don't share a cache entry."""
+        self.make_importer().extract(str(statement), [])
+        opened_statements.clear()
+
+        self.make_importer(skip_payments=True).extract(str(statement), [])
+
+        assert opened_statements
+
+    def test_cache_from_other_format_version_is_ignored(
+        self, statement, opened_statements, monkeypatch
+    ):
+        """Caches written with another PARSE_CACHE_VERSION are re-parsed."""
+        self.make_importer().extract(str(statement), [])
+        opened_statements.clear()
+
+        monkeypatch.setattr(
+            mastercard, "PARSE_CACHE_VERSION", mastercard.PARSE_CACHE_VERSION + 1
+        )
+        self.make_importer().extract(str(statement), [])
+
+        assert opened_statements
+
+    def test_corrupt_cache_is_ignored(self, statement):
+        """An unreadable cache file falls back to parsing the workbook."""
+        cache_path = statement.parent / "statement.xlsx.beancount-no-dnb.cache"
+        cache_path.write_bytes(b"not a pickle")
+
+        entries = self.make_importer().extract(str(statement), [])
+        assert len(entries) == 1
+
 
 class TestDateMethod:
     """Tests for the date() method."""
@@ -248,6 +414,11 @@ class TestDateMethod:
         # including balance forward (2025-11-10)
         assert result == datetime.date(2025, 11, 10)
 
+    def test_includes_skipped_rows(self, basic_importer, excel_with_all_types):
+        """date() counts the dates of rows that extract() skips."""
+        # The balance forward row (2025-11-10) is skipped by default
+        assert basic_importer.date(str(excel_with_all_types)) == datetime.date(2025, 11, 10)
+
     def test_returns_today_for_empty_file(self, basic_importer, tmp_path):
         """date() returns today's date for files with no valid transactions."""
         wb = Workbook()
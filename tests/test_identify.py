@@ -6,6 +6,8 @@ It checks:
 2. Excel headers match expected DNB format
 """
 
+import re
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -77,6 +79,119 @@ class TestIdentifyEdgeCases:
         result = basic_importer.identify(str(garbage_file))
         assert result is False
 
+    def test_zip_without_worksheet(self, basic_importer, tmp_path):
+        """Rejects .xlsx archives that have no first worksheet."""
+        file_path = tmp_path / "no_sheet.xlsx"
+        with zipfile.ZipFile(file_path, "w") as zf:
+            zf.writestr("docProps/app.xml", "<Properties/>")
+
+        assert basic_importer.identify(str(file_path)) is False
+
+    def test_truncated_worksheet_xml(self, basic_importer, tmp_path):
+        """Rejects archives whose worksheet XML ends before the header row."""
+        file_path = tmp_path / "truncated.xlsx"
+        with zipfile.ZipFile(file_path, "w") as zf:
+            zf.writestr("xl/worksheets/sheet1.xml", "<worksheet><sheetData><row r=")
+
+        assert basic_importer.identify(str(file_path)) is False
+
+    def test_worksheet_resolved_through_workbook_relationships(
+        self, basic_importer, minimal_excel_file, rewrite_xlsx, tmp_path
+    ):
+        """Finds the first worksheet when it is not named sheet1.xml."""
+
+        def rename_sheet(name, content):
+            if name == "xl/worksheets/sheet1.xml":
+                name = "xl/worksheets/statement.xml"
+            elif name in ("xl/_rels/workbook.xml.rels", "[Content_Types].xml"):
+                content = content.replace(b"sheet1.xml", b"statement.xml")
+            return name, content
+
+        file_path = rewrite_xlsx(
+            minimal_excel_file, tmp_path / "renamed_sheet.xlsx", rename_sheet
+        )
+
+        assert basic_importer.identify(str(file_path)) is True
+
+    def test_shared_strings_resolved_through_workbook_relationships(
+        self, basic_importer, tmp_path
+    ):
+        """Finds the shared strings table when it is not xl/sharedStrings.xml."""
+        ns = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+        rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+        pkg_ns = "http://schemas.openxmlformats.org/package/2006/relationships"
+        headers = ["Dato", "Beløpet gjelder", "Valuta", "Kurs", "Inn", "Ut"]
+        cells = "".join(
+            f'<c r="{col}1" t="s"><v>{idx}</v></c>'
+            for idx, col in enumerate("ABCDEF")
+        )
+        strings = "".join(f"<si><t>{header}</t></si>" for header in headers)
+
+        file_path = tmp_path / "renamed_strings.xlsx"
+        with zipfile.ZipFile(file_path, "w") as zf:
+            zf.writestr(
+                "xl/workbook.xml",
+                f'<workbook xmlns="{ns}" xmlns:r="{rel_ns}"><sheets>'
+                '<sheet name="Sheet" sheetId="1" r:id="rId1"/></sheets></workbook>',
+            )
+            zf.writestr(
+                "xl/_rels/workbook.xml.rels",
+                f'<Relationships xmlns="{pkg_ns}">'
+                f'<Relationship Id="rId1" Type="{rel_ns}/worksheet" Target="worksheets/sheet1.xml"/>'
+                f'<Relationship Id="rId2" Type="{rel_ns}/sharedStrings" Target="strings/table.xml"/>'
+                "</Relationships>",
+            )
+            zf.writestr(
+                "xl/worksheets/sheet1.xml",
+                f'<worksheet xmlns="{ns}"><sheetData><row r="1">{cells}</row>'
+                "</sheetData></worksheet>",
+            )
+            zf.writestr("xl/strings/table.xml", f'<sst xmlns="{ns}">{strings}</sst>')
+
+        assert basic_importer.identify(str(file_path)) is True
+
+    def test_checks_first_sheet_in_tab_order(
+        self, basic_importer, rewrite_xlsx, tmp_path
+    ):
+        """Headers are read from the sheet extract() parses, not sheet1.xml."""
+        wb = Workbook()
+        wb.active.append(["Dato", "Beløpet gjelder", "Valuta", "Kurs", "Inn", "Ut"])
+        wb.create_sheet("Notes").append(["Something", "Else"])
+        saved = tmp_path / "saved.xlsx"
+        wb.save(saved)
+
+        # Move the Notes tab first; its part stays xl/worksheets/sheet2.xml
+        def swap_tabs(name, content):
+            if name == "xl/workbook.xml":
+                first, second = re.findall(rb"<sheet [^>]*/>", content)
+                content = content.replace(first + second, second + first)
+            return name, content
+
+        file_path = rewrite_xlsx(saved, tmp_path / "reordered.xlsx", swap_tabs)
+
+        assert basic_importer.identify(str(file_path)) is False
+
+    def test_shared_string_headers(self, basic_importer, tmp_path):
+        """Resolves headers stored in the shared strings table."""
+        ns = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+        headers = ["Dato", "Beløpet gjelder", "Valuta", "Kurs", "Inn", "Ut"]
+        cells = "".join(
+            f'<c r="{col}1" t="s"><v>{idx}</v></c>'
+            for idx, col in enumerate("ABCDEF")
+        )
+        strings = "".join(f"<si><t>{header}</t></si>" for header in headers)
+
+        file_path = tmp_path / "shared_strings.xlsx"
+        with zipfile.ZipFile(file_path, "w") as zf:
+            zf.writestr(
+                "xl/worksheets/sheet1.xml",
+                f'<worksheet xmlns="{ns}"><sheetData><row r="1">{cells}</row>'
+                "</sheetData></worksheet>",
+            )
+            zf.writestr("xl/sharedStrings.xml", f'<sst xmlns="{ns}">{strings}</sst>')
+
+        assert basic_importer.identify(str(file_path)) is True
+
 
 class TestAccountMethod:
     """Tests for the account() method."""
@@ -96,7 +96,7 @@ class TestExcelFileData:
     def test_create_empty(self):
         """Can create with empty transaction list."""
         data = ExcelFileData()
-        assert data.transactions == []
+        assert data.transactions == ()
         assert data.sheet_name is None
 
     def test_create_with_transactions(self):
@@ -108,3 +108,32 @@ class TestExcelFileData:
         data = ExcelFileData(transactions=txns, sheet_name="transaksjonsliste")
         assert len(data.transactions) == 2
         assert data.sheet_name == "transaksjonsliste"
+
+    def test_stores_rows_column_wise(self):
+        """Rows are stored as parallel column lists."""
+        data = ExcelFileData()
+        data.append_row(
+            datetime.date(2025, 10, 24), "TXN 1", None, None, None, Decimal("150.50")
+        )
+        data.append(RawTransaction(date=datetime.date(2025, 10, 25), description="TXN 2"))
+
+        assert len(data) == 2
+        assert data.dates == [datetime.date(2025, 10, 24), datetime.date(2025, 10, 25)]
+        assert data.descriptions == ["TXN 1", "TXN 2"]
+        assert data.debits == [Decimal("150.50"), None]
+
+    def test_transactions_view_matches_rows(self):
+        """transactions rebuilds RawTransaction objects from the columns."""
+        txn = RawTransaction(
+            date=datetime.date(2025, 10, 24),
+            description="TXN 1",
+            credit=Decimal("100.00"),
+        )
+        data = ExcelFileData(transactions=[txn])
+        assert data.transactions == (txn,)
+
+    def test_transactions_view_is_read_only(self):
+        """Appending to the transactions view fails instead of being lost."""
+        data = ExcelFileData()
+        with pytest.raises(AttributeError):
+            data.transactions.append(RawTransaction(description="TXN 1"))